@@ -16,32 +16,63 @@ python academicteam_question_generator.py --questions /path/to/db.db
 
 import argparse
 import csv
+import functools
+import itertools
+import mmap
+import os
+import pickle
 import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
-# PDF imports
-from reportlab.lib.pagesizes import letter
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, KeepTogether
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+# Fixed row height for the sixty-second round tables, set once reportlab is loaded
+_ROW_H = None
 
-class AcademicTeamQuestionGenerator:
-    """Class to represent all functions and data for generating the KofC database"""
+# Bumped whenever the pickled question bank layout changes
+_QUESTION_CACHE_VERSION = 3
 
-    def __init__(self, data_path="questions.csv", seedval=None):
-        self.data_path = data_path
-        self.seedval = seedval
-        self.pdf_story = []
-        self.pdf_styles = getSampleStyleSheet()
-        self.setup_pdf_styles()
+# Tossups kept together as one block; fewer, larger blocks mean fewer re-layouts
+_TOSSUPS_PER_GROUP = 4
+
+_REPORTLAB_LOADED = False
+
+
+def _ensure_reportlab():
+    """Import the reportlab names used by the generator on first use"""
+    # pylint: disable=global-statement,import-outside-toplevel,redefined-outer-name
+    global _REPORTLAB_LOADED, _ROW_H
+    global letter, colors, inch
+    global SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, KeepTogether
+    global getSampleStyleSheet, ParagraphStyle, TA_CENTER, TA_LEFT, TA_RIGHT
+    if _REPORTLAB_LOADED:
+        return
+
+    # PDF imports
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib import colors
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, KeepTogether
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 
-    def setup_pdf_styles(self):
-        """Setup custom PDF styles"""
-        self.pdf_styles.add(ParagraphStyle(
+    _ROW_H = 0.15 * inch
+    _REPORTLAB_LOADED = True
+
+# Shared stylesheet, built once on first use and reused by every generator
+_STYLES = None
+
+
+def get_pdf_styles():
+    """Return the shared PDF stylesheet, registering the custom styles on first use"""
+    # pylint: disable=global-statement
+    global _STYLES
+    if _STYLES is None:
+        _ensure_reportlab()
+        styles = getSampleStyleSheet()
+        styles.add(ParagraphStyle(
             name='SmallItalicTitle',
-            parent=self.pdf_styles['Title'],
+            parent=styles['Title'],
             fontSize=16,
             spaceAfter=40,
             spaceBefore=80,
@@ -49,10 +80,10 @@ class AcademicTeamQuestionGenerator:
             textColor=colors.black,
             fontName='Times-Italic'
         ))
-        
-        self.pdf_styles.add(ParagraphStyle(
+    
+        styles.add(ParagraphStyle(
             name='CustomTitle',
-            parent=self.pdf_styles['Title'],
+            parent=styles['Title'],
             fontSize=28,
             spaceAfter=20,
             spaceBefore=20,
@@ -62,83 +93,117 @@ class AcademicTeamQuestionGenerator:
         ))
 
         # Answer Style
-        self.pdf_styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='AnswerStyle',
-            parent=self.pdf_styles['Normal'],
+            parent=styles['Normal'],
             leftIndent=20
         ))
 
         # Center style
-        self.pdf_styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CenterNormal',
-            parent=self.pdf_styles['Normal'],
+            parent=styles['Normal'],
             alignment=TA_CENTER,
             fontSize=10
         ))
 
         # Right style
-        self.pdf_styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='RightNormal',
-            parent=self.pdf_styles['Normal'],
+            parent=styles['Normal'],
             alignment=TA_RIGHT,
             fontSize=10
         ))
 
         # Left Style
-        self.pdf_styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='LeftNormal',
-            parent=self.pdf_styles['Normal'],
+            parent=styles['Normal'],
             alignment=TA_LEFT,
             fontSize=9,
             fontName='Times-Roman'
         ))
 
-        self.pdf_styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CategoryTitle',
-            parent=self.pdf_styles['Normal'],            
+            parent=styles['Normal'],            
             alignment=TA_CENTER,
             fontName="Times-Bold",
             fontSize=12
         ))
 
         # Bold Style
-        self.pdf_styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='BoldNormal',
-            parent=self.pdf_styles['CategoryTitle'],
+            parent=styles['CategoryTitle'],
             alignment=TA_LEFT,
             fontSize=10,
         ))
 
+        _STYLES = styles
+    return _STYLES
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_para(text, style_name):
+    """Build a Paragraph once per (text, style name) pair"""
+    return Paragraph(text, get_pdf_styles()[style_name])
+
+
+class AcademicTeamQuestionGenerator:  # pylint: disable=too-many-instance-attributes
+    """Class to represent all functions and data for generating the KofC database"""
+
+    def __init__(self, data_path="./book1.csv", seedval=None, strict_csv=False):
+        self.data_path = data_path
+        self.seedval = seedval
+        self.strict_csv = strict_csv
+        self.pdf_story = []
+        self.pdf_styles = get_pdf_styles()
+        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        # Styles used for every tossup and sixty-second row
+        self._style_normal = self.pdf_styles['Normal']
+        self._style_answer = self.pdf_styles['AnswerStyle']
+        self._style_left = self.pdf_styles['LeftNormal']
+        self._style_bold = self.pdf_styles['BoldNormal']
+
+        self._empty_para = self._para('', self._style_normal)
+
+    def _para(self, text, style):
+        """Return a cached Paragraph for the given text and style"""
+        return _cached_para(text, style.name)
+
     def create_title_page(self, grades='5&6', tournament_type='Practice Questions', year='2025-2026', game_number='1'):
         """Create the title page for the game document."""
         title_elements = []
+        custom_title = self.pdf_styles['CustomTitle']
 
         # Add main title
-        title_elements.append(Paragraph("Saint John Nepomuk Academic Team", self.pdf_styles['SmallItalicTitle']))
-        title_elements.append(Paragraph(f"Grades {grades}", self.pdf_styles['CustomTitle']))
-        title_elements.append(Paragraph(f"{tournament_type}", self.pdf_styles['CustomTitle']))
-        title_elements.append(Paragraph("Questions", self.pdf_styles['CustomTitle']))
-        title_elements.append(Paragraph(f"{year}", self.pdf_styles['CustomTitle']))
+        title_elements.append(self._para("Saint John Nepomuk Academic Team", self.pdf_styles['SmallItalicTitle']))
+        title_elements.append(self._para(f"Grades {grades}", custom_title))
+        title_elements.append(self._para(f"{tournament_type}", custom_title))
+        title_elements.append(self._para("Questions", custom_title))
+        title_elements.append(self._para(f"{year}", custom_title))
         title_elements.append(Spacer(width=0, height=80))
-        title_elements.append(Paragraph(f"Game {game_number}", self.pdf_styles['CustomTitle']))
+        title_elements.append(self._para(f"Game {game_number}", custom_title))
         
         # Add page break after title page
         title_elements.append(PageBreak())
         
         return title_elements
 
-    def create_tossup_round(self, question_number, question_data):
+    def create_tossup_round(self, question_number, question, answer):
         """Create a PDF table for tossup questions"""
         data = [
             # Row 1: Role (spanning all columns)
             [
-                Paragraph(question_number, self.pdf_styles["Normal"]),
-                Paragraph(question_data['q'], self.pdf_styles['Normal'])
+                self._para(question_number, self._style_normal),
+                self._para(question, self._style_normal)
             ],
             # Row 2: Details
             [
-                Paragraph("", self.pdf_styles['Normal']),
-                Paragraph(question_data['a'], self.pdf_styles['AnswerStyle']),
+                self._empty_para,
+                self._para(answer, self._style_answer),
             ]
         ]
         
@@ -158,9 +223,11 @@ class AcademicTeamQuestionGenerator:
         #     ('TOPPADDING', (0, 0), (-1, 0), 5),
         #     ('BACKGROUND', (0, 1), (-1, -1), colors.white),
             ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            # Keep the question with its answer even when its batch has to be split
+            ('NOSPLIT', (0, 0), (-1, -1)),
         ]))
         
-        return KeepTogether(table)
+        return table
     
     def create_sixtysecond_round(self, round_data):
         """A"""
@@ -170,28 +237,35 @@ class AcademicTeamQuestionGenerator:
         questions = round_data['questions']
 
         elements = []
-        elements.append(Paragraph(title, self.pdf_styles['CategoryTitle']))
+        elements.append(self._para(title, self.pdf_styles['CategoryTitle']))
         elements.append(Spacer(0, 4))
-        elements.append(Paragraph(instruct, self.pdf_styles['LeftNormal']))        
+        elements.append(self._para(instruct, self._style_left))        
         elements.append(Spacer(0, 2))
 
-        data = []
-        data.append([Paragraph(''), Paragraph(''), Paragraph('')])
-        for i, question in enumerate(questions):
-            if i == 10:
-                data.append([Paragraph('EXTRA:', self.pdf_styles['BoldNormal']), Paragraph(''), Paragraph('')])
+        left = self._style_left
+        para = self._para
 
-            data.append([
-                Paragraph(str(i+1), self.pdf_styles['LeftNormal']),
-                Paragraph(question['q'], self.pdf_styles['LeftNormal']),
-                Paragraph(question['a'], self.pdf_styles['LeftNormal'])
-            ])
+        # Blank cells are plain strings, so no Paragraph is built for them
+        head = [['', '', '']]
+
+        # The first ten questions, then the extras under an EXTRA: marker row
+        first10 = [
+            [para(str(i+1), left), para(question['q'], left), para(question['a'], left)]
+            for i, question in enumerate(questions[:10])
+        ]
+        extras = [
+            [para(str(i+1), left), para(question['q'], left), para(question['a'], left)]
+            for i, question in enumerate(questions[10:], start=10)
+        ]
+        if extras:
+            extras.insert(0, [para('EXTRA:', self._style_bold), '', ''])
+        data = head + first10 + extras
 
         table = Table(
             data,
             #colWidths=[0.4*inch, 2.0*inch, 3.6*inch],
             colWidths=[0.4*inch, None, None],
-            rowHeights=[0.15*inch for _ in data]
+            rowHeights=(_ROW_H,) * len(data)
         )
 
         # Table styling (no borders)
@@ -231,34 +305,95 @@ class AcademicTeamQuestionGenerator:
             ]
         }
     
-    def get_tossup_question_data(self, filename='./book1.csv'):
-        """Randomly samples from the questions file 20 questions"""
-        data = []
-        with open(filename, 'r', encoding='utf-8') as csvfile:
-            reader = csv.reader(csvfile, delimiter=',', quotechar='"')
-            for row in reader:
-                data.append(
-                    {
-                        'q': row[0],
-                        'a': row[1],
-                        'category': row[2],
-                        'grade': row[3]
-                    }
-                )
-
+    def iter_question_rows(self, filename):
+        """Yield the fields of each row in the questions file as UTF-8 bytes"""
+        if self.strict_csv:
+            with open(filename, 'r', encoding='utf-8', newline='') as csvfile:
+                for row in csv.reader(csvfile, delimiter=',', quotechar='"'):
+                    yield [field.encode('utf-8') for field in row]
+            return
+
+        with open(filename, 'rb') as rawfile:
+            if os.fstat(rawfile.fileno()).st_size == 0:
+                return
+            mm = mmap.mmap(rawfile.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                # Fast path: split the raw bytes, only lines containing quotes are decoded for the csv module
+                raw_lines = iter(mm.readline, b'')
+                for raw in raw_lines:
+                    if b'"' in raw:
+                        # The csv module pulls further lines only while a quoted field is still open
+                        text_lines = (line.decode('utf-8') for line in itertools.chain([raw], raw_lines))
+                        for row in csv.reader(text_lines, delimiter=',', quotechar='"'):
+                            yield [field.encode('utf-8') for field in row]
+                            break
+                    else:
+                        yield raw.rstrip(b'\r\n').split(b',')
+            finally:
+                mm.close()
+
+    def load_question_bank(self, filename):
+        """Return the questions file as parallel (questions, answers, categories, grades) lists of UTF-8 bytes, using a pickled cache when it is current"""
+        cache = filename + '.pkl'
+        stat = os.stat(filename)
+        # The parse mode is part of the key so --strict-csv never reuses a fast-path parse
+        key = (_QUESTION_CACHE_VERSION, self.strict_csv, stat.st_mtime_ns, stat.st_size)
+
+        try:
+            with open(cache, 'rb') as cachefile:
+                cached_key, bank = pickle.load(cachefile)
+            if cached_key == key:
+                return bank
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError, TypeError):
+            pass
+
+        bank = ([], [], [], [])
+        questions, answers, categories, grades = bank
+        for row in self.iter_question_rows(filename):
+            if len(row) < 4:
+                continue
+            questions.append(row[0])
+            answers.append(row[1])
+            categories.append(row[2])
+            grades.append(row[3])
+
+        # Write to a temporary file and swap it in, so parallel workers never read a partial cache
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(cache) + '.', suffix='.tmp',
+                                            dir=os.path.dirname(cache) or '.')
+            with os.fdopen(fd, 'wb') as cachefile:
+                pickle.dump((key, bank), cachefile, protocol=5)
+            os.replace(tmp_path, cache)
+        except OSError:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        return bank
+
+    def iter_tossup_questions(self, filename=None, num_questions=20):
+        """Randomly samples num_questions questions from the questions file, yielding (question, answer) pairs"""
+        questions, answers, _, _ = self.load_question_bank(filename or self.data_path)
+        num_rows = len(questions)
+        if num_rows < num_questions:
+            raise ValueError("Sample larger than population")
+
+        # The bank is already in memory, so sample row indices directly
         rng = random.Random(self.seedval)
-        sample_size = 20
-        return rng.sample(data, sample_size)
+        indices = rng.sample(range(num_rows), num_questions)
 
-    def generate_document(self, output_base):
+        # Only the sampled rows are ever decoded
+        for i in indices:
+            yield questions[i].decode('utf-8'), answers[i].decode('utf-8')
+
+    def generate_document(self, output_base, num_tossup=20, game_number=1):
         """Generate PDF document with simple linked TOC"""
         print("Generating PDF document with simple TOC...")
         
         margin_factor = 1.0
 
         # Generate PDF document with timestamp        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        pdf_filename = f"{output_base}_{timestamp}.pdf"
+        pdf_filename = f"{output_base}_{self.timestamp}.pdf"
 
         doc = SimpleDocTemplate(pdf_filename, pagesize=letter,
                             rightMargin=margin_factor*inch, leftMargin=margin_factor*inch,
@@ -267,15 +402,18 @@ class AcademicTeamQuestionGenerator:
         story = []
         
         # Add title page
-        story.extend(self.create_title_page())
+        story.extend(self.create_title_page(game_number=str(game_number)))
         
         # tossup section with anchor
-        questions = self.get_tossup_question_data()
-        if questions:
-            for n, question in enumerate(questions):
-                print(f"Writing question {n+1}")
-                story.append(self.create_tossup_round(f"{n+1}", question))
-                story.append(Spacer(1, 15))
+        group = []
+        for n, (question, answer) in enumerate(self.iter_tossup_questions(num_questions=num_tossup)):
+            group.append(self.create_tossup_round(f"{n+1}", question, answer))
+            group.append(Spacer(1, 15))
+            if len(group) == 2 * _TOSSUPS_PER_GROUP:
+                story.append(KeepTogether(group))
+                group = []
+        if group:
+            story.append(KeepTogether(group))
             
         # story.append(PageBreak())
 
@@ -300,15 +438,35 @@ class AcademicTeamQuestionGenerator:
         doc.build(story)
         print(f"PDF document saved as: {pdf_filename}")
 
+def _build_one(args, output_base, seedval, game_number):
+    """Generate a single game document; top-level so it can run in a worker process"""
+    generator = AcademicTeamQuestionGenerator(args.questions, seedval, args.strict_csv)
+    generator.generate_document(output_base, args.num_tossup, game_number)
+
 def main():
     """Main function"""
     parser = argparse.ArgumentParser(description='Academic Team Game Generator')
-    parser.add_argument('--questions', default='questions.csv', help='questions file path')
+    parser.add_argument('--questions', default='./book1.csv', help='questions file path')
     parser.add_argument('--output', default='Questions', help='Output filename base')
+    parser.add_argument('--num-tossup', type=int, default=20, help='Number of tossup questions per game')
+    parser.add_argument('--num-games', type=int, default=1, help='Number of games to generate')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed (game N uses seed + N - 1)')
+    parser.add_argument('--strict-csv', action='store_true', help='Parse the questions file entirely with the csv module')
     args = parser.parse_args()
     
-    generator = AcademicTeamQuestionGenerator(args.questions)
-    generator.generate_document(args.output)
+    if args.num_games > 1:
+        # Each game is an independent PDF, so build them in parallel
+        games = range(1, args.num_games + 1)
+        with ProcessPoolExecutor() as executor:
+            list(executor.map(
+                _build_one,
+                [args] * args.num_games,
+                [f"{args.output}_g{n}" for n in games],
+                [None if args.seed is None else args.seed + n - 1 for n in games],
+                games
+            ))
+    else:
+        _build_one(args, args.output, args.seed, 1)
     
     print("\nSuccess! Directory generated as PDF")
 
@@ -0,0 +1,54 @@
+"""Tests for the question file parsing in academicteam_question_generator"""
+
+import os
+import tempfile
+import unittest
+
+from academicteam_question_generator import AcademicTeamQuestionGenerator
+
+
+class QuestionRowParsingTest(unittest.TestCase):
+    """The fast parse path must agree with --strict-csv"""
+
+    def assert_fast_matches_strict(self, content):
+        """Write content to a temporary file and compare both parse paths"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'questions.csv')
+            with open(filename, 'wb') as questions_file:
+                questions_file.write(content)
+
+            fast = AcademicTeamQuestionGenerator(filename)
+            strict = AcademicTeamQuestionGenerator(filename, strict_csv=True)
+            fast_rows = list(fast.iter_question_rows(filename))
+            strict_rows = list(strict.iter_question_rows(filename))
+
+        self.assertEqual(fast_rows, strict_rows)
+        return fast_rows
+
+    def test_plain_rows(self):
+        """Rows without quotes are split directly"""
+        rows = self.assert_fast_matches_strict(b'q1,a1,math,56\nq2,a2,math,56\n')
+        self.assertEqual(len(rows), 2)
+
+    def test_quoted_fields(self):
+        """Quoted commas and doubled quotes go through the csv module"""
+        rows = self.assert_fast_matches_strict(
+            b'"q1, with comma",a1,c,56\r\nq2,"say ""hi""",c,56\r\n')
+        self.assertEqual(rows[0][0], b'q1, with comma')
+        self.assertEqual(rows[1][1], b'say "hi"')
+
+    def test_quoted_field_spanning_lines(self):
+        """A quoted field may continue onto following lines"""
+        rows = self.assert_fast_matches_strict(b'q1,a1,c,56\n"multi\nline q",a2,c,56\nq3,a3,c,56\n')
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[1][0], b'multi\nline q')
+
+    def test_literal_quote_inside_unquoted_field(self):
+        """A quote inside an unquoted field is a literal character, not a field opener"""
+        rows = self.assert_fast_matches_strict(b'Height 5" tall,a1,c,56\nq2,a2,c,56\nq3,a3,c,56\n')
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0][0], b'Height 5" tall')
+
+
+if __name__ == '__main__':
+    unittest.main()